@@ -2,7 +2,7 @@
 Voice channel control commands.
 - /start: Join the invoker's current voice channel (does not move if already connected)
 - /stop: Leave the current voice channel in this guild
-- 時報: audio フォルダー内の 1.mp3～24.mp3 を毎正時に再生（減税は未設置）
+- 時報: audio フォルダー内の 時報.mp3 と 0.wav～23.wav を毎正時に再生
 
 Responses are in Japanese to match the request.
 """
@@ -10,7 +10,11 @@ Responses are in Japanese to match the request.
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime, timedelta
+import functools
+import io
+import os
+import time
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Optional
 
@@ -19,57 +23,382 @@ from discord.ext import commands
 from discord.ext.commands import Context
 
 
-AUDIO_DIR = Path(__file__).resolve().parent.parent / "audio"
-JIHOU_FILE = AUDIO_DIR / "時報.mp3"
+@functools.cache
+def audio_dir() -> Path:
+    """audio フォルダーの場所を一度だけ解決して返す。
+    realpath のシンボリックリンク走査を import のたびに払わずに済み、
+    ZIHOU_AUDIO_DIR 環境変数で置き場所を差し替えることもできる。
+    """
+    return Path(
+        os.environ.get("ZIHOU_AUDIO_DIR")
+        or Path(__file__).resolve().parent.parent / "audio"
+    )
+
+
+@functools.cache
+def jihou_file() -> Path:
+    """毎正時の頭に鳴らす共通の時報ファイル。"""
+    return audio_dir() / "時報.mp3"
+
+
+@functools.cache
+def hour_paths() -> tuple[Path, ...]:
+    """0〜23 時に対応する wav のパス表。24 通りしかないので一度だけ組み立てる。"""
+    return tuple(audio_dir() / f"{h}.wav" for h in range(24))
+
+# FFmpeg の起動遅延（probe/analyze とバッファリング）を抑える入力オプション
+FFMPEG_BEFORE = "-fflags nobuffer -flags low_delay -probesize 32 -analyzeduration 0"
+
+# 正時の何秒前に音源の組み立てを始めるか。play() の瞬間を :00 に合わせるための先読み
+PREWARM_SECONDS = 1.0
+
+
+def _next_top_of_hour_ts() -> int:
+    """次の正時を epoch 秒で返す。
+    整数演算だけなので datetime の生成が不要で、DST 切り替えの影響も受けない。
+    """
+    return (int(time.time()) // 3600 + 1) * 3600
+
+
+def _seconds_to_next_hour() -> float:
+    """次の正時までの残り秒数を返す。"""
+    return _next_top_of_hour_ts() - time.time()
+
+
+class PCMFramesSource(discord.AudioSource):
+    """事前に 20ms 単位へスライス済みの PCM フレーム列を送出する AudioSource。
+    read() は next(iterator) 一発で、各フレームは親 bytes を共有する memoryview。
+    """
+
+    def __init__(self, frames: list[memoryview]) -> None:
+        self._iter = iter(frames)
+
+    def read(self) -> bytes:
+        return bytes(next(self._iter, b""))
+
+
+class OpusFramesSource(discord.AudioSource):
+    """事前に Opus エンコード済みの 20ms フレーム列をそのまま送出する AudioSource。
+    is_opus() が True なので discord.py 側での毎フレーム再エンコードが走らない。
+    """
+
+    def __init__(self, frames: list[bytes]) -> None:
+        self._iter = iter(frames)
+
+    def read(self) -> bytes:
+        return next(self._iter, b"")
+
+    def is_opus(self) -> bool:
+        return True
+
+
+@dataclass(slots=True)
+class GuildState:
+    """ギルドごとの時報関連の状態。複数の dict に分散させず 1 箇所に集約する。"""
+
+    # 次の正時に 1 回だけ再生するワンショットタスク
+    oneshot: Optional[asyncio.Task] = None
+    # ワンショットの結果を通知するテキストチャンネル
+    notify_channel_id: Optional[int] = None
 
 
 class Voice(commands.Cog, name="voice"):
     def __init__(self, bot) -> None:
         self.bot = bot
-        # ギルドごとの時報タスクを管理
-        self._hourly_tasks: Dict[int, asyncio.Task] = {}
-        # 次の正時に1回だけ再生するワンショットタスク
-        self._oneshot_tasks: Dict[int, asyncio.Task] = {}
-
-    def cog_unload(self) -> None:
-        # Cog unload 時に全タスクを停止
-        for task in self._hourly_tasks.values():
-            task.cancel()
-        for task in self._oneshot_tasks.values():
-            task.cancel()
+        # Bot 全体で 1 本だけ動かす時報スケジューラー
+        self._hourly_task: Optional[asyncio.Task] = None
+        # ギルドごとの状態（ワンショットタスク・通知先など）
+        self._state: Dict[int, GuildState] = {}
+        # 再生シーケンス進行中のギルド。値は現在のトラックの完了 Future
+        self._playing: Dict[int, asyncio.Future] = {}
+        # 起動時にデコード済みの生 PCM (48kHz/stereo/s16le) を保持するキャッシュ
+        self._pcm_cache: Dict[Path, bytes] = {}
+        # 事前に 20ms 単位へスライス済みの PCM フレーム列（libopus がない環境の再生路）
+        self._pcm_frames: Dict[Path, list[memoryview]] = {}
+        # 事前に Opus エンコード済みの 20ms フレーム列（libopus がある場合のみ）
+        self._opus_cache: Dict[Path, list[bytes]] = {}
+        # ディスク上に存在する時刻（0〜23）のスナップショット。毎時 stat() しないためのキャッシュ
+        self._available: frozenset[int] = frozenset()
+        self._available_names: frozenset[str] = frozenset()
+        self._jihou_available: bool = False
+        # 実行中タスクへの強参照。これがないと GC にタスクを回収される恐れがある
+        # https://docs.python.org/3/library/asyncio-task.html#asyncio.create_task
+        self._tasks: set[asyncio.Task] = set()
+        # Cog 停止の協調シグナル。CancelledError を再生途中に投げ込まずに済む
+        self._stop = asyncio.Event()
+        # 正時の起床シグナル。loop.call_later のタイマーヒープに直接載せる
+        self._tick = asyncio.Event()
+        self._tick_handle: Optional[asyncio.TimerHandle] = None
+        # 通知メッセージの送信キュー。再生経路を Discord HTTP の 429 待ちから切り離す
+        self._notify_q: asyncio.Queue[tuple[int, str]] = asyncio.Queue(maxsize=256)
+        self._notify_worker_task: Optional[asyncio.Task] = None
+
+    def _track_task(self, task: asyncio.Task) -> asyncio.Task:
+        """タスクが完了するまで強参照を保持する。"""
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def cog_load(self) -> None:
+        # 毎時の再生で FFmpeg を起動し直さないよう、最初に全ファイルをデコードしておく
+        await self._refresh_available()
+        self._notify_worker_task = self._track_task(
+            asyncio.create_task(self._notify_worker())
+        )
+
+    async def _refresh_available(self) -> None:
+        """audio フォルダーを走査し直してスナップショットと各キャッシュを作り直す。
+        ホットパスはメモリだけを見るため、運用者がファイルを差し替えたときは
+        /reload_audio からこれを呼んで反映する。
+        """
+        self._pcm_cache.clear()
+        self._pcm_frames.clear()
+        self._opus_cache.clear()
+        self._scan_available()
+        await self._build_pcm_cache()
+        self._build_pcm_frames()
+        # Opus エンコードは CPU を食うので、イベントループを止めずにスレッドで行う
+        await asyncio.to_thread(self._build_opus_cache)
+
+    async def _notify_worker(self) -> None:
+        """キュー経由で届いた通知メッセージを 1 本のワーカーで直列に送信する。
+        :00 に全ギルドが一斉に send するとレート制限のバックオフが再生まで
+        遅らせてしまうため、HTTP 送信は再生経路から切り離しておく。
+        """
+        while True:
+            channel_id, message = await self._notify_q.get()
+            try:
+                channel = self.bot.get_channel(channel_id)
+                if isinstance(channel, (discord.TextChannel, discord.Thread)):
+                    await channel.send(message)
+            except discord.HTTPException:
+                pass
+            finally:
+                self._notify_q.task_done()
+
+    def _scan_available(self) -> None:
+        """audio フォルダーを一度だけ走査して、存在する時刻ファイルを記録する。
+        不足分の警告もここで一度だけ出す（毎時 stat して毎時警告しない）。
+        """
+        try:
+            names = frozenset(entry.name for entry in os.scandir(audio_dir()))
+        except OSError:
+            names = frozenset()
+        self._available_names = names
+        self._available = frozenset(
+            h for h in range(24) if self._hour_to_filename(h) in names
+        )
+        self._jihou_available = jihou_file().name in names
+        missing = sorted(set(range(24)) - self._available)
+        if missing:
+            self.bot.logger.warning(
+                "時報用の音声が不足しています: "
+                + ", ".join(self._hour_to_filename(h) for h in missing)
+            )
+        if not self._jihou_available:
+            self.bot.logger.warning(self._fmt_missing(jihou_file()))
+
+    async def _build_pcm_cache(self) -> None:
+        """audio フォルダー内の音声を 48kHz/stereo/s16le の生 PCM に一度だけデコードする。
+        - 毎正時に FFmpeg プロセスを生成・解析するコストをなくすのが目的。
+        - デコードできなかったファイルは従来どおり FFmpegPCMAudio で再生する。
+        """
+        targets = [jihou_file(), *hour_paths()]
+        # 起動を引き延ばさないよう数本ずつ並列にデコードする
+        semaphore = asyncio.Semaphore(4)
 
-    async def _play_sequence(self, voice_client: discord.VoiceClient, paths: list[Path]) -> bool:
+        async def decode(path: Path) -> None:
+            if not path.exists():
+                return
+            async with semaphore:
+                try:
+                    proc = await asyncio.create_subprocess_exec(
+                        "ffmpeg", "-i", str(path),
+                        "-f", "s16le", "-ar", "48000", "-ac", "2", "pipe:1",
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.DEVNULL,
+                    )
+                    pcm, _ = await proc.communicate()
+                    if proc.returncode == 0 and pcm:
+                        self._pcm_cache[path] = pcm
+                    else:
+                        self.bot.logger.warning(f"PCM デコードに失敗しました: {path.name}")
+                except Exception as e:
+                    self.bot.logger.error(f"PCM キャッシュの構築に失敗しました ({path.name}): {e}")
+
+        await asyncio.gather(*(decode(path) for path in targets))
+        if self._pcm_cache:
+            total = sum(len(b) for b in self._pcm_cache.values())
+            self.bot.logger.info(
+                f"音声キャッシュを構築しました: {len(self._pcm_cache)} ファイル ({total / 1048576:.1f} MiB)"
+            )
+
+    def _build_pcm_frames(self) -> None:
+        """キャッシュ済み PCM を 20ms フレームに事前スライスする。
+        再生中の read() が BytesIO の読み出し管理ではなくイテレーターの前進だけになり、
+        各フレームは親 bytes を共有する memoryview なのでコピーも発生しない。
+        """
+        frame_size = discord.opus.Encoder.FRAME_SIZE  # 3840 bytes = 20ms @ 48kHz/stereo/s16le
+        for path, pcm in list(self._pcm_cache.items()):
+            if len(pcm) % frame_size:
+                # 端数は無音でパディングして全フレームを 20ms に揃える
+                pcm = pcm + b"\x00" * (frame_size - len(pcm) % frame_size)
+                self._pcm_cache[path] = pcm
+            view = memoryview(pcm)
+            self._pcm_frames[path] = [
+                view[i : i + frame_size] for i in range(0, len(pcm), frame_size)
+            ]
+
+    def _build_opus_cache(self) -> None:
+        """キャッシュ済み PCM を 20ms フレーム単位で Opus に事前エンコードする。
+        再生のたびに送信スレッドで走る PCM→Opus エンコードを丸ごと省ける。
+        libopus がロードできない環境では PCM キャッシュのみで動作する。
+        """
+        if not discord.opus.is_loaded():
+            try:
+                discord.opus._load_default()
+            except Exception:
+                pass
+        if not discord.opus.is_loaded():
+            self.bot.logger.info("libopus が見つからないため Opus の事前エンコードをスキップします")
+            return
+        frame_size = discord.opus.Encoder.FRAME_SIZE  # 20ms @ 48kHz/stereo/s16le
+        cache: Dict[Path, list[bytes]] = {}
+        for path, pcm in self._pcm_cache.items():
+            try:
+                encoder = discord.opus.Encoder()
+                frames: list[bytes] = []
+                for i in range(0, len(pcm), frame_size):
+                    chunk = pcm[i : i + frame_size]
+                    if len(chunk) < frame_size:
+                        # 末尾は無音でパディングして 20ms に揃える
+                        chunk = chunk.ljust(frame_size, b"\x00")
+                    frames.append(
+                        encoder.encode(chunk, discord.opus.Encoder.SAMPLES_PER_FRAME)
+                    )
+                cache[path] = frames
+            except Exception as e:
+                self.bot.logger.error(f"Opus 事前エンコードに失敗しました ({path.name}): {e}")
+        # スレッドから直接書き込まず、完成した辞書を一括で差し替える
+        self._opus_cache = cache
+
+    def _make_source(self, path: Path) -> discord.AudioSource:
+        """エンコード済み Opus → メモリ上の PCM → FFmpeg デコードの順で音源を返す。
+        キャッシュ済みデータ本体（不変の bytes / フレームリスト）は全ギルドで共有され、
+        呼び出しごとに作られるのは読み出し位置を持つ薄いラッパーだけ。正時に N ギルドへ
+        同時に流してもデコード済みバッファのコピーは発生しない。
+        """
+        frames = self._opus_cache.get(path)
+        if frames is not None:
+            return OpusFramesSource(frames)
+        pcm_frames = self._pcm_frames.get(path)
+        if pcm_frames is not None:
+            return PCMFramesSource(pcm_frames)
+        pcm = self._pcm_cache.get(path)
+        if pcm is not None:
+            return discord.PCMAudio(io.BytesIO(pcm))
+        return discord.FFmpegPCMAudio(str(path), before_options=FFMPEG_BEFORE)
+
+    async def _make_source_async(self, path: Path) -> discord.AudioSource:
+        """_make_source の非同期版。キャッシュヒット時はそのまま返し、FFmpeg への
+        フォールバック時だけ subprocess 生成（fork+exec とパイプ敷設）をスレッドへ
+        逃がして、その間イベントループが止まらないようにする。
+        """
+        if (
+            path in self._opus_cache
+            or path in self._pcm_frames
+            or path in self._pcm_cache
+        ):
+            return self._make_source(path)
+        return await asyncio.to_thread(
+            discord.FFmpegPCMAudio, str(path), before_options=FFMPEG_BEFORE
+        )
+
+    async def cog_unload(self) -> None:
+        # Cog unload 時に全タスクを停止（まず協調シグナル、残りはキャンセル）
+        self._stop.set()
+        # タイマー待ちのスケジューラーも起こして抜けさせる
+        self._tick.set()
+        if self._tick_handle:
+            self._tick_handle.cancel()
+        tasks = [t for t in (self._hourly_task, self._notify_worker_task) if t]
+        tasks.extend(state.oneshot for state in self._state.values() if state.oneshot)
+        for task in tasks:
+            task.cancel()
+        # cancel() は投げっぱなしにせず、全タスクの終了（finally 含む）を待ち切る。
+        # CancelledError ごと回収するので unload がここで例外にならない。
+        await asyncio.gather(*tasks, return_exceptions=True)
+        # 再生中の FFmpeg 子プロセスが残らないよう、音声クライアントも止めておく
+        for voice_client in list(self.bot.voice_clients):
+            try:
+                voice_client.stop()
+            except Exception:
+                pass
+
+    async def _play_sequence(
+        self,
+        voice_client: discord.VoiceClient,
+        paths: list[Path],
+        sources: Optional[list[discord.AudioSource]] = None,
+    ) -> bool:
         """指定された複数の音声ファイルを順番に再生する。
         - 1つ以上再生できた場合 True を返す。
         - すべて存在しない/失敗した場合は False。
         - 例外はログに記録し、次のトラックに進む。
+        - sources に組み立て済みの音源（paths と同順）を渡すと、それをそのまま使う。
         """
         played_any = False
-        for p in paths:
-            if not p.exists():
-                # ファイルがない場合はスキップ
-                self.bot.logger.warning(self._fmt_missing(p))
-                continue
-            try:
-                # もしまだ何か再生中なら待つ
-                while voice_client.is_playing() or voice_client.is_paused():
-                    await asyncio.sleep(0.2)
-                source = discord.FFmpegPCMAudio(str(p))
-                voice_client.play(source)
-                played_any = True
-                # 再生が終わるまで待機
-                while voice_client.is_playing():
-                    await asyncio.sleep(0.2)
-            except Exception as e:
-                self.bot.logger.error(f"音声再生に失敗しました ({p.name}): {e}")
-                # 失敗したら次のトラックへ
-                continue
+        loop = asyncio.get_running_loop()
+        guild_id = voice_client.guild.id
+        if guild_id in self._playing:
+            # このギルドでは別のシーケンスが再生中（O(1) のガード。ポーリング不要）
+            return False
+        current: Optional[asyncio.Future] = None
+        try:
+            for i, p in enumerate(paths):
+                if p.name not in self._available_names:
+                    # ファイルがない場合はスキップ（起動時/再走査時のスナップショットを参照）
+                    self.bot.logger.warning(self._fmt_missing(p))
+                    continue
+                # 呼び出し側が事前にガード（または stop()）しているので、それでも何かが
+                # 鳴っていたら競合とみなし、ポーリングで待たずにこの回は打ち切る
+                if voice_client.is_playing() or voice_client.is_paused():
+                    break
+                try:
+                    source = (
+                        sources[i] if sources is not None else await self._make_source_async(p)
+                    )
+                    # after= コールバックで終了を通知してもらい、ポーリングせずに待つ
+                    done: asyncio.Future[Optional[Exception]] = loop.create_future()
+
+                    def _finished(err: Optional[Exception], fut: asyncio.Future = done) -> None:
+                        loop.call_soon_threadsafe(lambda: fut.done() or fut.set_result(err))
+
+                    current = done
+                    self._playing[guild_id] = done
+                    voice_client.play(source, after=_finished)
+                    played_any = True
+                    # 再生が終わるまで待機（音声スレッドからの通知）
+                    err = await done
+                    if self._playing.get(guild_id) is not done:
+                        # /test などに横取りされた。残りのトラックは再生しない
+                        return played_any
+                    if err is not None:
+                        self.bot.logger.error(f"音声再生に失敗しました ({p.name}): {err}")
+                except Exception as e:
+                    self.bot.logger.error(f"音声再生に失敗しました ({p.name}): {e}")
+                    # 失敗したら次のトラックへ
+                    continue
+        finally:
+            # 横取りされた場合は新しいシーケンスの登録を消さない
+            if current is not None and self._playing.get(guild_id) is current:
+                self._playing.pop(guild_id, None)
         return played_any
 
     @staticmethod
     def _hour_to_filename(hour: int) -> str:
-        """0..23 の時刻を 1..24.wav にマッピング
-        例: 1時→1.wav, 13時→13.wav,
+        """0..23 の時刻を 0.wav..23.wav にマッピング
+        例: 0時→0.wav, 13時→13.wav
         """
         return f"{hour}.wav"
 
@@ -77,116 +406,187 @@ class Voice(commands.Cog, name="voice"):
     def _fmt_missing(file: Path) -> str:
         return f"音声ファイルが見つかりません: {file}"
 
-    async def _hourly_chime_loop(self, guild_id: int) -> None:
-        """ギルドごとに動作する時報ループ。
-        - 常に次の“ちょうどの時刻”まで待機し、対応する wav を再生
-        - ボイス未接続 / 切断時は待機を継続（/start で再接続すればそのまま動作）
-        - 再生中で埋まっている場合はその時間の時報はスキップ
-        """
-        while True:
-            # 次の正時まで待機
-            now = datetime.now()
-            next_top = (now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1))
-            await asyncio.sleep(max(0.0, (next_top - now).total_seconds()))
-
-            # 現在のギルドの VoiceClient を取得
-            guild = self.bot.get_guild(guild_id)
-            if guild is None:
-                continue
-            voice_client: Optional[discord.VoiceClient] = guild.voice_client  # type: ignore[attr-defined]
-
-            # 接続していなければスキップ（次の時間を待つ）
-            if not voice_client or not voice_client.is_connected():
-                continue
 
-            # すでに再生中なら今回はスキップ
-            if voice_client.is_playing() or voice_client.is_paused():
-                continue
+    async def _hourly_chime_loop(self) -> None:
+        """全ギルド共通の時報ループ（Bot 全体でタスクは 1 本だけ）。
+        - 目標時刻（正時）をアンカーとして保持し、毎回そこまで待機して再生
+        - 接続中の全 VoiceClient へ同時に時報を流す（ギルドごとにタスクを増やさない）
+        - 未接続 / すでに再生中のギルドはその回をスキップ
+        - 再生が長引いて正時を跨いだ場合は、過ぎた正時をまとめて読み飛ばす
+        """
+        # 次に鳴らすべき正時（epoch 秒）。sleep のズレに左右されないよう絶対時刻で持ち回す
+        next_target = _next_top_of_hour_ts()
+        # 壁時計は目標時刻の決定だけに使い、待機そのものは単調クロックで測る。
+        # NTP による時刻の飛び（巻き戻し/前進）があっても待機時間が壊れない
+        loop = asyncio.get_running_loop()
+        # ループ内で毎回属性チェーンを辿らないよう、不変の参照はローカルに束縛しておく
+        monotonic = loop.time
+        wall = time.time
+        localtime = time.localtime
+        sleep = asyncio.sleep
+        bot = self.bot
+        paths = hour_paths()
+        jihou = jihou_file()
+        deadline = monotonic() + (next_target - wall())
+        while not self._stop.is_set():
+            # 正時の少し手前まで待ち、残り時間で音源を組み立てる
+            delay = deadline - PREWARM_SECONDS - monotonic()
+            if delay > 0:
+                # sleep コルーチンを挟まず、イベントループのタイマーヒープへ直接
+                # ワンショットタイマーを載せて起床する。停止時は cog_unload が
+                # 同じイベントを立てるので、途中でもすぐ抜けられる
+                self._tick.clear()
+                self._tick_handle = loop.call_later(delay, self._tick.set)
+                await self._tick.wait()
+            if self._stop.is_set():
+                return
 
-            # 再生するファイルを決定
-            hour = datetime.now().hour
-            filename = self._hour_to_filename(hour)
-            path = AUDIO_DIR / filename
-
-            # 時報(共通) + 時間の順で再生
-            played = await self._play_sequence(voice_client, [JIHOU_FILE, path])
-            if not played:
-                # どちらも再生できなかった場合は一度だけ警告
-                if not JIHOU_FILE.exists() and not path.exists():
-                    self.bot.logger.warning(self._fmt_missing(path))
+            if next_target < wall():
+                # サスペンド復帰などで正時を寝過ごした場合は、過ぎた時報を
+                # 鳴らさずに次の正時へアンカーを張り直して待機に戻る
+                while next_target < wall():
+                    next_target += 3600
+                deadline = monotonic() + (next_target - wall())
                 continue
 
-
-    def _ensure_hourly_task(self, guild_id: int) -> None:
-        task = self._hourly_tasks.get(guild_id)
+            try:
+                # 再生するファイルを決定（アンカーの時刻を使う）
+                hour = localtime(next_target).tm_hour
+                path = paths[hour]
+
+                # 再生できるものだけ並べる（不足は起動時に警告済み）
+                seq: list[Path] = []
+                if self._jihou_available:
+                    seq.append(jihou)
+                if hour in self._available:
+                    seq.append(path)
+                if not seq:
+                    continue
+
+                # 再生可能な VoiceClient を集める（未接続・再生中はスキップ）
+                clients = [
+                    vc
+                    for vc in bot.voice_clients
+                    if isinstance(vc, discord.VoiceClient)
+                    and vc.is_connected()
+                    and vc.guild.id not in self._playing
+                    and not (vc.is_playing() or vc.is_paused())
+                ]
+                if not clients:
+                    continue
+
+                # :00 より前に音源を組み立てておき、正時には play するだけにする
+                prepared = []
+                for vc in clients:
+                    prepared.append(
+                        (vc, [await self._make_source_async(p) for p in seq])
+                    )
+                # 最後の ~50ms は sleep(0) で刻んで、スケジューラーの起床遅れを
+                # 持ち越さずに :00 ちょうどへ着地させる
+                remaining = deadline - monotonic() - 0.05
+                if remaining > 0:
+                    await sleep(remaining)
+                while monotonic() < deadline:
+                    await sleep(0)
+
+                # 時報(共通) + 時間の順で、全ギルド同時に再生
+                await asyncio.gather(
+                    *(
+                        self._play_sequence(vc, seq, sources=srcs)
+                        for vc, srcs in prepared
+                    )
+                )
+            except Exception as e:
+                # 音源の組み立て失敗（FFmpeg 未導入など）でスケジューラー本体を
+                # 殺さない。ログに残して次の正時に再挑戦する
+                bot.logger.error(f"時報の再生に失敗しました: {e}")
+            finally:
+                # 次の正時へ。既に過ぎていれば（長い再生など）そのぶん読み飛ばす
+                next_target += 3600
+                while next_target < wall():
+                    next_target += 3600
+                # 単調クロックはサスペンド中に止まるなど壁時計と乖離し得るので、
+                # 締切は毎回アンカーから張り直す（個々の待機の計測は単調クロックのまま）
+                deadline = monotonic() + (next_target - wall())
+
+    def _ensure_hourly_task(self) -> None:
+        task = self._hourly_task
         if task is None or task.done() or task.cancelled():
-            self._hourly_tasks[guild_id] = asyncio.create_task(self._hourly_chime_loop(guild_id))
+            self._hourly_task = self._track_task(
+                asyncio.create_task(self._hourly_chime_loop())
+            )
 
-    def _cancel_hourly_task(self, guild_id: int) -> None:
-        task = self._hourly_tasks.pop(guild_id, None)
+    def _cancel_hourly_task(self) -> None:
+        task = self._hourly_task
+        self._hourly_task = None
         if task:
             task.cancel()
 
-    async def _wait_and_play_once(self, guild_id: int, notify_channel_id: Optional[int]) -> None:
+    async def _wait_and_play_once(self, guild_id: int) -> None:
         """次の正時まで待機して、対応する wav を1回だけ再生する。
-        再生可否はその時点の接続状態に依存（未接続ならスキップ）。
-        実行後は oneshot タスク登録をクリーンアップ。
+        - 通知先は GuildState.notify_channel_id（/start を実行したチャンネル）。
+        - 共有スケジューラーが先に鳴らしていた場合は通知だけ行う。
+        - oneshot タスク登録の後始末は _schedule_oneshot の done コールバックが行う。
         """
-        try:
-            now = datetime.now()
-            next_top = (now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1))
-            await asyncio.sleep(max(0.0, (next_top - now).total_seconds()))
+        state = self._state.setdefault(guild_id, GuildState())
+        notify_channel_id = state.notify_channel_id
 
-            guild = self.bot.get_guild(guild_id)
-            if guild is None:
-                return
-            voice_client: Optional[discord.VoiceClient] = guild.voice_client  # type: ignore[attr-defined]
-
-            if not voice_client or not voice_client.is_connected():
-                # 接続していないので今回はスキップ
-                if notify_channel_id:
-                    channel = self.bot.get_channel(notify_channel_id)
-                    if isinstance(channel, (discord.TextChannel, discord.Thread)):
-                        try:
-                            await channel.send("指定時刻になりましたが、ボイスチャンネルに接続していないため再生をスキップしました。/start で接続してください。")
-                        except Exception:
-                            pass
+        def notify(message: str) -> None:
+            # 送信はワーカーに任せ、再生経路を HTTP 待ちでブロックしない
+            if not notify_channel_id:
                 return
+            try:
+                self._notify_q.put_nowait((notify_channel_id, message))
+            except asyncio.QueueFull:
+                self.bot.logger.warning("通知キューが一杯のため通知を破棄しました")
 
-            # 既に再生中ならスキップ
-            if voice_client.is_playing() or voice_client.is_paused():
-                return
+        await asyncio.sleep(_seconds_to_next_hour())
 
-            hour = datetime.now().hour  # 正時になっている想定
-            filename = self._hour_to_filename(hour)
-            path = AUDIO_DIR / filename
+        guild = self.bot.get_guild(guild_id)
+        if guild is None:
+            return
+        voice_client: Optional[discord.VoiceClient] = guild.voice_client  # type: ignore[attr-defined]
 
-            # 時報(共通) + 時間の順で再生
-            played = await self._play_sequence(voice_client, [JIHOU_FILE, path])
-            if notify_channel_id:
-                channel = self.bot.get_channel(notify_channel_id)
-                if isinstance(channel, (discord.TextChannel, discord.Thread)):
-                    try:
-                        if played:
-                            await channel.send(f"{hour}時の時報を再生します。")
-                        else:
-                            # どちらも再生できなかった場合
-                            if not JIHOU_FILE.exists() and not path.exists():
-                                await channel.send(self._fmt_missing(path))
-                            else:
-                                await channel.send("音声再生に失敗しました。FFmpeg の導入やファイルの存在を確認してください。")
-                    except Exception:
-                        pass
-        finally:
-            # タスク終了時にクリア
-            self._oneshot_tasks.pop(guild_id, None)
+        if not voice_client or not voice_client.is_connected():
+            # 接続していないので今回はスキップ
+            notify("指定時刻になりましたが、ボイスチャンネルに接続していないため再生をスキップしました。/start で接続してください。")
+            return
+
+        hour = time.localtime().tm_hour  # 正時になっている想定
+        path = hour_paths()[hour]
+
+        # 既に再生中（共有スケジューラーが先に鳴らした）なら通知だけ
+        if guild_id in self._playing or voice_client.is_playing() or voice_client.is_paused():
+            notify(f"{hour}時の時報を再生します。")
+            return
+
+        # 時報(共通) + 時間の順で再生
+        played = await self._play_sequence(voice_client, [jihou_file(), path])
+        if played:
+            notify(f"{hour}時の時報を再生します。")
+        elif hour not in self._available and not self._jihou_available:
+            # どちらも再生できなかった場合
+            notify(self._fmt_missing(path))
+        else:
+            notify("音声再生に失敗しました。FFmpeg の導入やファイルの存在を確認してください。")
 
     def _schedule_oneshot(self, guild_id: int, notify_channel_id: Optional[int]) -> None:
+        state = self._state.setdefault(guild_id, GuildState())
         # 既存があれば置き換え
-        prev = self._oneshot_tasks.pop(guild_id, None)
-        if prev:
-            prev.cancel()
-        self._oneshot_tasks[guild_id] = asyncio.create_task(self._wait_and_play_once(guild_id, notify_channel_id))
+        if state.oneshot:
+            state.oneshot.cancel()
+        state.notify_channel_id = notify_channel_id
+        task = self._track_task(
+            asyncio.create_task(self._wait_and_play_once(guild_id))
+        )
+
+        def _clear_slot(t: asyncio.Task, s: GuildState = state) -> None:
+            # 新しい oneshot に置き換えられていた場合は消さない（stale-pop 防止）
+            if s.oneshot is t:
+                s.oneshot = None
+
+        task.add_done_callback(_clear_slot)
+        state.oneshot = task
 
     @commands.hybrid_command(name="start", description="あなたがいるボイスチャンネルに参加します（毎正時に時報を流します）")
     @commands.guild_only()
@@ -222,12 +622,14 @@ class Voice(commands.Cog, name="voice"):
             await ctx.send(f"ボイス接続中にエラーが発生しました: {e}")
             return
 
-        # ギルドの時報タスクを起動
+        # 時報スケジューラーを起動（既に動いていれば何もしない）
         if ctx.guild:
-            self._ensure_hourly_task(ctx.guild.id)
-            # audio ディレクトリ存在確認を一度案内
-            if not AUDIO_DIR.exists():
-                await ctx.send(f"注意: 音声フォルダーが見つかりませんでした: `{AUDIO_DIR}`\n`audio/1.mp3` ～ `audio/24.mp3` を配置してください。")
+            self._ensure_hourly_task()
+            # 最初の正時はコマンドを実行したチャンネルに結果を通知する
+            self._schedule_oneshot(ctx.guild.id, ctx.channel.id)
+            # 音声ファイルの有無を一度案内（起動時スナップショットを参照）
+            if not self._available and not self._jihou_available:
+                await ctx.send(f"注意: 音声ファイルが見つかりませんでした: `{audio_dir()}`\n`audio/0.wav` ～ `audio/23.wav` を配置してください。")
 
     @commands.hybrid_command(name="stop", description="ボイスチャンネルから切断します（時報も停止）")
     @commands.guild_only()
@@ -245,8 +647,18 @@ class Voice(commands.Cog, name="voice"):
         except discord.ClientException as e:
             await ctx.send(f"切断時にエラーが発生しました: {e}")
         finally:
+            # /start が予約したワンショットも止める。残すと次の正時に
+            # 「/start で接続してください」と停止直後のユーザーへ通知してしまう
             if ctx.guild:
-                self._cancel_hourly_task(ctx.guild.id)
+                state = self._state.get(ctx.guild.id)
+                if state:
+                    if state.oneshot:
+                        state.oneshot.cancel()
+                    state.notify_channel_id = None
+            # どのギルドにも接続していなければスケジューラー自体も止める
+            # （次の /start が改めて起動する）
+            if not self.bot.voice_clients:
+                self._cancel_hourly_task()
 
     @commands.hybrid_command(name="test", description="次の時間の音声を今すぐ一度だけ再生します（必要なら接続します）")
     @commands.guild_only()
@@ -284,21 +696,23 @@ class Voice(commands.Cog, name="voice"):
             return
 
         # Determine next hour and audio files (時報 + 時間)
-        now = datetime.now()
-        next_hour = (now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)).hour
+        next_hour = (time.localtime().tm_hour + 1) % 24
         filename = self._hour_to_filename(next_hour)
-        path = AUDIO_DIR / filename
+        path = hour_paths()[next_hour]
 
         # Stop current playback if any, then play the sequence immediately
         try:
             if voice_client.is_playing() or voice_client.is_paused():
                 voice_client.stop()
-            played = await self._play_sequence(voice_client, [JIHOU_FILE, path])
+                # 進行中のシーケンスから登録を外し、横取りしたことを伝える
+                if ctx.guild:
+                    self._playing.pop(ctx.guild.id, None)
+            played = await self._play_sequence(voice_client, [jihou_file(), path])
             if played:
                 await ctx.send(f"{next_hour}時の時報を再生します。（順番: 時報 → {filename}）")
             else:
                 # どちらも再生不可
-                if not JIHOU_FILE.exists() and not path.exists():
+                if next_hour not in self._available and not self._jihou_available:
                     await ctx.send(self._fmt_missing(path))
                 else:
                     await ctx.send("音声再生に失敗しました。FFmpeg の導入やファイルの存在を確認してください。")
@@ -308,5 +722,18 @@ class Voice(commands.Cog, name="voice"):
             return
 
 
+    @commands.hybrid_command(name="reload_audio", description="audio フォルダーを再走査して音声キャッシュを作り直します")
+    @commands.is_owner()
+    async def reload_audio(self, ctx: Context) -> None:
+        """Rescan the audio folder and rebuild the in-memory caches.
+        ホットパスはディスクを見ないため、ファイルを差し替えたらこのコマンドで反映する。
+        """
+        await self._refresh_available()
+        await ctx.send(
+            f"音声キャッシュを再構築しました（時刻ファイル: {len(self._available)}/24、"
+            f"時報: {'あり' if self._jihou_available else 'なし'}）。"
+        )
+
+
 async def setup(bot):
     await bot.add_cog(Voice(bot))